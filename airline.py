@@ -1,37 +1,101 @@
+import atexit
+import os
+import warnings
 import pandas as pd
 import numpy as np
+import matplotlib
+if not os.environ.get("AIRLINE_INTERACTIVE"):
+    matplotlib.use("Agg")
 import matplotlib.pyplot as plt
+import seaborn as sns
+from dataclasses import dataclass
 from datetime import datetime
 
+FLIGHT_DTYPES = {
+    'flight_id': 'string',
+    'airline': 'category',
+    'origin': 'category',
+    'destination': 'category',
+    'departure_time': 'string',
+    'arrival_time': 'string',
+    'delay_minutes': 'int64',
+    'status': 'category'
+}
+
+# Same schema but lets pandas infer delay_minutes (blank or fractional cells).
+INFERRED_DELAY_DTYPES = {col: dtype for col, dtype in FLIGHT_DTYPES.items() if col != 'delay_minutes'}
+
+DELAY_CATEGORIES = ("On-time", "Moderate Delay", "High Delay")
+MODERATE_DELAY_MAX = 30
+
+def _classify_delay(delay):
+    if delay == 0:
+        return 0
+    elif delay <= MODERATE_DELAY_MAX:
+        return 1
+    else:
+        return 2
+
+_delay_ufunc = None
+
+def _numba_classifier():
+    # Numba is imported and the ufunc built on first use, not at import, so
+    # CLI start-up doesn't pay for it. Each input dtype compiles on first call.
+    global _delay_ufunc
+    if _delay_ufunc is None:
+        try:
+            import numba
+        except ImportError:
+            _delay_ufunc = False
+        else:
+            _delay_ufunc = numba.vectorize(cache=True)(_classify_delay)
+    return _delay_ufunc
+
+def narrow_delays(delays):
+    if not pd.api.types.is_integer_dtype(delays) or delays.empty:
+        return delays
+    low, high = delays.min(), delays.max()
+    for dtype in (np.int16, np.int32):
+        info = np.iinfo(dtype)
+        if info.min <= low and high <= info.max:
+            return delays.astype(dtype)
+    return delays
+
+def categorize_delays(delays):
+    delays = np.asarray(delays)
+    classify = _numba_classifier()
+    if classify:
+        return classify(delays).astype(np.int8, copy=False)
+    return np.select([delays == 0, delays <= MODERATE_DELAY_MAX], [0, 1], default=2).astype(np.int8)
+
 def step_log(func):
-    def wrapper(*args, **kwargs):
+    def wrapper(self, *args, **kwargs):
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         log_msg = f"[{timestamp}] Executing: {func.__name__}"
         print(log_msg)
         
-        with open("logs.txt", "a") as log_file:
-            log_file.write(log_msg + "\n")
+        self._log(log_msg)
         
-        result = func(*args, **kwargs)
+        result = func(self, *args, **kwargs)
         
         completion_msg = f"[{timestamp}] Completed: {func.__name__}"
-        with open("logs.txt", "a") as log_file:
-            log_file.write(completion_msg + "\n")
+        self._log(completion_msg, flush=True)
         
         return result
     return wrapper
 
+# Single-flight value object. Bulk work belongs on AirlineAnalytics.df;
+# don't materialise a list of these per row.
+@dataclass(slots=True, frozen=True)
 class FlightRecord:
-    def __init__(self, flight_id, airline, origin, destination, 
-                 departure, arrival, delay, status):
-        self.flight_id = flight_id
-        self.airline = airline
-        self.origin = origin
-        self.destination = destination
-        self.departure = departure
-        self.arrival = arrival
-        self.delay = delay
-        self.status = status
+    flight_id: str
+    airline: str
+    origin: str
+    destination: str
+    departure: str
+    arrival: str
+    delay: int
+    status: str
     
     def to_dict(self):
         return {
@@ -50,11 +114,11 @@ class FlightRecord:
     
     def delay_category(self):
         if self.delay == 0:
-            return "On-time"
-        elif self.delay <= 30:
-            return "Moderate Delay"
+            return DELAY_CATEGORIES[0]
+        elif self.delay <= MODERATE_DELAY_MAX:
+            return DELAY_CATEGORIES[1]
         else:
-            return "High Delay"
+            return DELAY_CATEGORIES[2]
     
     def __repr__(self):
         return f"FlightRecord({self.flight_id}, {self.airline}, {self.delay}min)"
@@ -64,14 +128,61 @@ class AirlineAnalytics:
         self.data_file = data_file
         self.log_file = log_file
         self.df = None
+        self._cache = {}
         
         with open(self.log_file, "w") as f:
             f.write(f"=== Airline Analytics Log Started at {datetime.now()} ===\n")
+        
+        # Append mode so instances sharing a log file don't overwrite each other.
+        self._log_fh = open(self.log_file, "a", buffering=8192)
+        atexit.register(self._log_fh.close)
+    
+    def close(self):
+        if not self._log_fh.closed:
+            self._log_fh.close()
+        atexit.unregister(self._log_fh.close)
+    
+    def _log(self, msg, flush=False):
+        if self._log_fh.closed:
+            with open(self.log_file, "a") as f:
+                f.write(msg + "\n")
+            return
+        self._log_fh.write(msg + "\n")
+        if flush:
+            self._log_fh.flush()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+    
+    def _avg_delay(self):
+        if 'avg' not in self._cache:
+            self._cache['avg'] = self.df.groupby('airline', observed=True)['delay_minutes'].mean().sort_values(ascending=False)
+        return self._cache['avg']
+    
+    def _read_flights(self):
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore', RuntimeWarning)
+                df = pd.read_csv(self.data_file, usecols=list(FLIGHT_DTYPES),
+                                 dtype=FLIGHT_DTYPES, engine='c')
+            # Parsed as int64 so out-of-range values can't wrap; narrow only
+            # once the observed range is known to fit.
+            df['delay_minutes'] = narrow_delays(df['delay_minutes'])
+            return df
+        except (ValueError, OverflowError):
+            # Blank or fractional delays don't fit an integer dtype; let pandas
+            # infer delay_minutes (float64 with NaN) as it did without a schema.
+            return pd.read_csv(self.data_file, usecols=list(FLIGHT_DTYPES),
+                               dtype=INFERRED_DELAY_DTYPES, engine='c')
     
     @step_log
     def load_data(self):
+        self._cache.clear()
         try:
-            self.df = pd.read_csv(self.data_file)
+            self.df = self._read_flights()
             print(f"Successfully loaded {len(self.df)} records from {self.data_file}")
             print(f"Columns: {list(self.df.columns)}\n")
             return True
@@ -82,26 +193,128 @@ class AirlineAnalytics:
             print(f"Error loading data: {e}")
             return False
     
+    def _stream_aggregates(self, chunksize, dtypes):
+        flights = {}
+        delay_counts = None
+        route_sums = None
+        route_counts = None
+        
+        reader = pd.read_csv(self.data_file, usecols=list(FLIGHT_DTYPES),
+                             dtype=dtypes, engine='c', chunksize=chunksize)
+        for chunk in reader:
+            for airline, n in chunk.groupby('airline', sort=False, observed=True).size().items():
+                flights[airline] = flights.get(airline, 0) + n
+            
+            counts = chunk.groupby(['airline', 'delay_minutes'], observed=True).size()
+            routes = chunk.groupby(['origin', 'airline'], observed=True)['delay_minutes']
+            sums = routes.sum()
+            n = routes.count()
+            
+            if delay_counts is None:
+                delay_counts, route_sums, route_counts = counts, sums, n
+            else:
+                delay_counts = delay_counts.add(counts, fill_value=0)
+                route_sums = route_sums.add(sums, fill_value=0)
+                route_counts = route_counts.add(n, fill_value=0)
+        
+        return flights, delay_counts, route_sums, route_counts
+    
     @step_log
-    def filter_data(self, airline=None, airport=None, month=None):
+    def load_data_streaming(self, chunksize=200_000):
+        # Aggregates the CSV chunk by chunk without keeping the rows, so
+        # self.df is left untouched. Returns (stats_df, pivot_origin): the
+        # same frames export_stats writes and plot_heatmap draws.
+        # Memory stays bounded because delays are whole minutes, so the
+        # per-(airline, delay) counts have few distinct keys. If the file has
+        # fractional delays (the inferred-float fallback), that table grows
+        # with the number of distinct values instead.
+        try:
+            try:
+                with warnings.catch_warnings():
+                    warnings.simplefilter('ignore', RuntimeWarning)
+                    flights, delay_counts, route_sums, route_counts = self._stream_aggregates(chunksize, FLIGHT_DTYPES)
+            except (ValueError, OverflowError):
+                flights, delay_counts, route_sums, route_counts = self._stream_aggregates(chunksize, INFERRED_DELAY_DTYPES)
+        except FileNotFoundError:
+            print(f"Error: File {self.data_file} not found!")
+            return None
+        except Exception as e:
+            print(f"Error loading data: {e}")
+            return None
+        
+        if not flights:
+            print(f"No records found in {self.data_file}")
+            return None
+        
+        stats = []
+        for airline, total in flights.items():
+            row = {'airline': airline, 'total_flights': total}
+            if airline in delay_counts.index.get_level_values('airline'):
+                airline_counts = delay_counts.xs(airline, level='airline').sort_index()
+                values = airline_counts.index.to_numpy()
+                delays = values.astype(np.float64)
+                freq = airline_counts.to_numpy(dtype=np.int64)
+                
+                count = freq.sum()
+                mean = (delays * freq).sum() / count
+                var = ((delays - mean) ** 2 * freq).sum() / (count - 1) if count > 1 else np.nan
+                cum = np.cumsum(freq)
+                lower = delays[np.searchsorted(cum, (count - 1) // 2, side='right')]
+                upper = delays[np.searchsorted(cum, count // 2, side='right')]
+                
+                row.update({
+                    'avg_delay': mean,
+                    'median_delay': (lower + upper) / 2,
+                    'max_delay': values[-1],
+                    'min_delay': values[0],
+                    'std_delay': np.sqrt(var),
+                    'on_time_pct': freq[delays == 0].sum() / total * 100,
+                    'delayed_pct': freq[delays > 0].sum() / total * 100
+                })
+            stats.append(row)
+        
+        stats_df = pd.DataFrame(stats, columns=['airline', 'total_flights', 'avg_delay', 'median_delay',
+                                                'max_delay', 'min_delay', 'std_delay',
+                                                'on_time_pct', 'delayed_pct'])
+        stats_df['on_time_pct'] = stats_df['on_time_pct'].fillna(0)
+        stats_df['delayed_pct'] = stats_df['delayed_pct'].fillna(0)
+        for col in ('max_delay', 'min_delay'):
+            if stats_df[col].notna().all():
+                stats_df[col] = narrow_delays(stats_df[col].astype(delay_counts.index.levels[1].dtype))
+        stats_df = stats_df.round(2)
+        
+        observed = route_counts > 0
+        pivot_origin = (route_sums[observed] / route_counts[observed]).unstack(fill_value=0).sort_index().sort_index(axis=1)
+        pivot_origin.index = pd.Index(pivot_origin.index.astype(str), name='origin')
+        pivot_origin.columns = pd.Index(pivot_origin.columns.astype(str), name='airline')
+        
+        print(f"Streamed {sum(flights.values())} records from {self.data_file} in chunks of {chunksize}")
+        print(f"Summary:\n{stats_df}\n")
+        return stats_df, pivot_origin
+    
+    @step_log
+    def filter_data(self, airline=None, airport=None, month=None, limit=None):
         if self.df is None:
             print("No data loaded.")
             return None
         
-        filtered_df = self.df.copy()
+        mask = np.ones(len(self.df), dtype=bool)
         
         if airline:
-            filtered_df = filtered_df[filtered_df['airline'] == airline]
+            mask &= (self.df['airline'] == airline).to_numpy()
             print(f"Filtered by airline: {airline}")
         
         if airport:
-            filtered_df = filtered_df[
-                (filtered_df['origin'] == airport) | 
-                (filtered_df['destination'] == airport)
-            ]
+            mask &= ((self.df['origin'] == airport) | 
+                     (self.df['destination'] == airport)).to_numpy()
             print(f"Filtered by airport: {airport}")
         
-        print(f"Filtered results: {len(filtered_df)} records\n")
+        if limit is not None:
+            filtered_df = self.df.iloc[np.flatnonzero(mask)[:limit]]
+        else:
+            filtered_df = self.df.loc[mask]
+        
+        print(f"Filtered results: {np.count_nonzero(mask)} records\n")
         return filtered_df
     
     @step_log
@@ -110,12 +323,12 @@ class AirlineAnalytics:
             print("No data loaded.")
             return None
         
-        avg_delays = self.df.groupby('airline')['delay_minutes'].mean().sort_values(ascending=False)
+        avg_delays = self._avg_delay()
         
         print("\nAverage Delay by Airline:")
         print("=" * 40)
-        for airline, delay in avg_delays.items():
-            print(f"{airline:20s} - {delay:.2f} mins")
+        print("\n".join(f"{airline:20s} - {delay:.2f} mins"
+                        for airline, delay in zip(avg_delays.index, avg_delays.to_numpy())))
         print("=" * 40 + "\n")
         
         return avg_delays
@@ -126,7 +339,7 @@ class AirlineAnalytics:
             print("No data loaded.")
             return None
         
-        trend_data = self.df.groupby('airline').agg({
+        trend_data = self.df.groupby('airline', observed=True).agg({
             'delay_minutes': ['mean', 'median', 'std', 'count']
         }).round(2)
         
@@ -142,19 +355,22 @@ class AirlineAnalytics:
             print("No data loaded.")
             return
         
-        plt.figure(figsize=(12, 6))
+        fig = plt.figure(figsize=(12, 6))
         
         plt.subplot(1, 2, 1)
-        plt.hist(self.df['delay_minutes'], bins=50, color='skyblue', edgecolor='black')
+        delays = self.df['delay_minutes'].dropna().to_numpy()
+        counts, edges = np.histogram(delays, bins=50)
+        plt.stairs(counts, edges, fill=True, facecolor='skyblue', edgecolor='black', linewidth=1)
         plt.xlabel('Delay (minutes)', fontsize=12)
         plt.ylabel('Frequency', fontsize=12)
         plt.title('Overall Delay Distribution', fontsize=14, fontweight='bold')
         plt.grid(axis='y', alpha=0.3)
         
         plt.subplot(1, 2, 2)
-        for airline in self.df['airline'].unique():
-            airline_data = self.df[self.df['airline'] == airline]['delay_minutes']
-            plt.hist(airline_data, alpha=0.5, label=airline, bins=30)
+        bins = np.histogram_bin_edges(delays, bins=30)
+        for airline, airline_data in self.df.groupby('airline', sort=False, observed=True)['delay_minutes']:
+            counts, _ = np.histogram(airline_data.dropna().to_numpy(), bins=bins)
+            plt.stairs(counts, bins, fill=True, alpha=0.5, label=airline)
         
         plt.xlabel('Delay (minutes)', fontsize=12)
         plt.ylabel('Frequency', fontsize=12)
@@ -168,8 +384,10 @@ class AirlineAnalytics:
             filename = 'delay_distribution.png'
             plt.savefig(filename, dpi=300, bbox_inches='tight')
             print(f"Plot saved: {filename}\n")
+        else:
+            plt.show()
         
-        plt.show()
+        plt.close(fig)
     
     @step_log
     def plot_average_delay_bar(self, save=True):
@@ -177,9 +395,9 @@ class AirlineAnalytics:
             print("No data loaded.")
             return
         
-        avg_delays = self.df.groupby('airline')['delay_minutes'].mean().sort_values(ascending=False)
+        avg_delays = self._avg_delay()
         
-        plt.figure(figsize=(10, 6))
+        fig = plt.figure(figsize=(10, 6))
         bars = plt.bar(avg_delays.index, avg_delays.values, color='coral', edgecolor='black')
         
         for bar in bars:
@@ -198,8 +416,10 @@ class AirlineAnalytics:
             filename = 'delay_by_airline.png'
             plt.savefig(filename, dpi=300, bbox_inches='tight')
             print(f"Plot saved: {filename}\n")
+        else:
+            plt.show()
         
-        plt.show()
+        plt.close(fig)
     
     @step_log
     def plot_heatmap(self, save=True):
@@ -207,29 +427,43 @@ class AirlineAnalytics:
             print("No data loaded.")
             return
         
-        pivot_origin = self.df.groupby(['origin', 'airline'])['delay_minutes'].mean().unstack(fill_value=0)
+        origins = self.df['origin'].cat
+        airlines = self.df['airline'].cat
+        n_origins, n_airlines = len(origins.categories), len(airlines.categories)
+        
+        oc = origins.codes.to_numpy()
+        ac = airlines.codes.to_numpy()
+        valid = (oc >= 0) & (ac >= 0)
+        cells = oc[valid].astype(np.int64) * n_airlines + ac[valid]
+        delays = self.df['delay_minutes'].to_numpy(dtype=np.float64)[valid]
+        has_delay = ~np.isnan(delays)
+        
+        size = n_origins * n_airlines
+        flights = np.bincount(cells, minlength=size).reshape(n_origins, n_airlines)
+        sums = np.bincount(cells[has_delay], weights=delays[has_delay], minlength=size)
+        counts = np.bincount(cells[has_delay], minlength=size)
+        means = np.divide(sums, counts, out=np.zeros(size), where=counts > 0).reshape(n_origins, n_airlines)
+        
+        # Like groupby(observed=True): only origins/airlines that have flights.
+        rows = flights.any(axis=1)
+        cols = flights.any(axis=0)
+        pivot_origin = pd.DataFrame(means[np.ix_(rows, cols)],
+                                    index=pd.Index(origins.categories[rows], name='origin'),
+                                    columns=pd.Index(airlines.categories[cols], name='airline'))
         
         fig, ax = plt.subplots(figsize=(12, 8))
         
-        im = ax.imshow(pivot_origin.values, cmap='YlOrRd', aspect='auto')
-        
-        ax.set_xticks(np.arange(len(pivot_origin.columns)))
-        ax.set_yticks(np.arange(len(pivot_origin.index)))
-        ax.set_xticklabels(pivot_origin.columns)
-        ax.set_yticklabels(pivot_origin.index)
+        sns.heatmap(pivot_origin, annot=True, fmt='.1f', cmap='YlOrRd', ax=ax,
+                    annot_kws={'color': 'black', 'fontsize': 9})
         
         plt.setp(ax.get_xticklabels(), rotation=45, ha="right", rotation_mode="anchor")
-        
-        for i in range(len(pivot_origin.index)):
-            for j in range(len(pivot_origin.columns)):
-                text = ax.text(j, i, f'{pivot_origin.values[i, j]:.1f}',
-                             ha="center", va="center", color="black", fontsize=9)
+        plt.setp(ax.get_yticklabels(), rotation=0)
         
         ax.set_xlabel('Airline', fontsize=12, fontweight='bold')
         ax.set_ylabel('Origin Airport', fontsize=12, fontweight='bold')
         ax.set_title('Airport vs Airline Delay Heatmap', fontsize=14, fontweight='bold')
         
-        cbar = plt.colorbar(im, ax=ax)
+        cbar = ax.collections[0].colorbar
         cbar.set_label('Average Delay (minutes)', rotation=270, labelpad=20)
         
         plt.tight_layout()
@@ -238,8 +472,10 @@ class AirlineAnalytics:
             filename = 'airport_delay_heatmap.png'
             plt.savefig(filename, dpi=300, bbox_inches='tight')
             print(f"Heatmap saved: {filename}\n")
+        else:
+            plt.show()
         
-        plt.show()
+        plt.close(fig)
     
     @step_log
     def export_stats(self, filename="delay_summary.csv"):
@@ -247,23 +483,21 @@ class AirlineAnalytics:
             print("No data loaded.")
             return False
         
-        stats = []
-        
-        for airline in self.df['airline'].unique():
-            airline_data = self.df[self.df['airline'] == airline]
-            stats.append({
-                'airline': airline,
-                'total_flights': len(airline_data),
-                'avg_delay': airline_data['delay_minutes'].mean(),
-                'median_delay': airline_data['delay_minutes'].median(),
-                'max_delay': airline_data['delay_minutes'].max(),
-                'min_delay': airline_data['delay_minutes'].min(),
-                'std_delay': airline_data['delay_minutes'].std(),
-                'on_time_pct': (airline_data['delay_minutes'] == 0).sum() / len(airline_data) * 100,
-                'delayed_pct': (airline_data['delay_minutes'] > 0).sum() / len(airline_data) * 100
-            })
-        
-        stats_df = pd.DataFrame(stats)
+        delays = self.df.groupby('airline', sort=False, observed=True)['delay_minutes']
+        stats_df = delays.agg(
+            total_flights='size',
+            avg_delay='mean',
+            median_delay='median',
+            max_delay='max',
+            min_delay='min',
+            std_delay='std'
+        )
+        
+        by_airline = self.df['airline']
+        stats_df['on_time_pct'] = self.df['delay_minutes'].eq(0).groupby(by_airline, sort=False, observed=True).mean() * 100
+        stats_df['delayed_pct'] = self.df['delay_minutes'].gt(0).groupby(by_airline, sort=False, observed=True).mean() * 100
+        
+        stats_df = stats_df.reset_index()
         stats_df = stats_df.round(2)
         stats_df.to_csv(filename, index=False)
         
@@ -276,20 +510,71 @@ class AirlineAnalytics:
             print("No data loaded.")
             return
         
+        delays = self.df['delay_minutes'].to_numpy()
+        total = delays.size
+        on_time = np.count_nonzero(delays == 0)
+        delayed = np.count_nonzero(delays > 0)
+        
         print("\n" + "=" * 60)
         print("DATASET SUMMARY")
         print("=" * 60)
-        print(f"Total Records: {len(self.df)}")
+        print(f"Total Records: {total}")
         print(f"Airlines: {', '.join(self.df['airline'].unique())}")
         print(f"Airports: {', '.join(self.df['origin'].unique())}")
         print(f"\nDelay Statistics:")
         print(f"  Average Delay: {self.df['delay_minutes'].mean():.2f} minutes")
         print(f"  Median Delay: {self.df['delay_minutes'].median():.2f} minutes")
         print(f"  Max Delay: {self.df['delay_minutes'].max():.2f} minutes")
-        print(f"  On-time Flights: {(self.df['delay_minutes'] == 0).sum()} ({(self.df['delay_minutes'] == 0).sum() / len(self.df) * 100:.1f}%)")
-        print(f"  Delayed Flights: {(self.df['delay_minutes'] > 0).sum()} ({(self.df['delay_minutes'] > 0).sum() / len(self.df) * 100:.1f}%)")
+        print(f"  On-time Flights: {on_time} ({on_time / total * 100:.1f}%)")
+        print(f"  Delayed Flights: {delayed} ({delayed / total * 100:.1f}%)")
         print("=" * 60 + "\n")
 
+def generate_dummy_csv(filename="dummy_flights.csv", num_records=1200, seed=None):
+    rng = np.random.default_rng(seed)
+    
+    airlines = np.array(['IndiGo', 'SpiceJet', 'Vistara', 'GoAir', 'Air India'])
+    airports = np.array(['DEL', 'BOM', 'BLR', 'MAA', 'CCU', 'HYD', 'AMD', 'PNQ'])
+    prefixes = np.array(['6E', 'SG', 'UK', 'G8', 'AI'])
+    
+    flight_id = np.char.add(rng.choice(prefixes, size=num_records),
+                            rng.integers(100, 1000, size=num_records).astype(str))
+    airline = rng.choice(airlines, size=num_records)
+    origin = rng.choice(airports, size=num_records)
+    destination = rng.choice(airports, size=num_records)
+    same = destination == origin
+    while same.any():
+        destination[same] = rng.choice(airports, size=same.sum())
+        same = destination == origin
+    
+    bucket = rng.choice(4, size=num_records, p=[0.6, 0.25, 0.10, 0.05])
+    low = np.array([0, 5, 31, 121])[bucket]
+    high = np.array([0, 30, 120, 180])[bucket]
+    delay = rng.integers(low, high + 1)
+    
+    departure = rng.integers(5, 23, size=num_records) * 60 + rng.choice([0, 15, 30, 45], size=num_records)
+    duration = rng.choice([60, 120], size=num_records, p=[0.1, 0.9])
+    arrival = (departure + duration + delay) % (24 * 60)
+    
+    status = np.where(delay == 0, 'on-time', 'delayed').astype('<U9')
+    cancelled = (bucket == 3) & (rng.random(num_records) < 0.4)
+    status[cancelled] = 'cancelled'
+    
+    clock = np.array([f"{m // 60:02d}:{m % 60:02d}" for m in range(24 * 60)])
+    
+    df = pd.DataFrame({
+        'flight_id': flight_id,
+        'airline': airline,
+        'origin': origin,
+        'destination': destination,
+        'departure_time': clock[departure],
+        'arrival_time': clock[arrival],
+        'delay_minutes': delay,
+        'status': status
+    })
+    df.to_csv(filename, index=False)
+    print(f"Generated {num_records} records in {filename}")
+    return df
+
 def display_menu():
     print("\n" + "=" * 60)
     print("AIRLINE DELAY VISUAL ANALYTICS TOOL")
@@ -308,8 +593,10 @@ def display_menu():
 
 def main():
     csv_file = "flights.csv"
-    analytics = AirlineAnalytics(data_file=csv_file)
-    
+    with AirlineAnalytics(data_file=csv_file) as analytics:
+        run_menu(analytics)
+
+def run_menu(analytics):
     while True:
         display_menu()
         choice = input("Enter your choice (0-9): ").strip()
@@ -346,9 +633,9 @@ def main():
             print("\nFilter Options:")
             airline = input("Enter airline (or press Enter to skip): ").strip() or None
             airport = input("Enter airport code (or press Enter to skip): ").strip() or None
-            filtered_df = analytics.filter_data(airline=airline, airport=airport)
+            filtered_df = analytics.filter_data(airline=airline, airport=airport, limit=10)
             if filtered_df is not None:
-                print(filtered_df.head(10))
+                print(filtered_df)
         
         elif choice == '0':
             print("\nThank you for using Airline Delay Analytics Tool!")